@@ -26,20 +26,15 @@ logging.basicConfig(
                     level=logging.INFO
 )
 
-@app.post("/upload-database-file")
-async def upload_db_file(
-    file: UploadFile
-) -> dict:
-    """Uploads a CSV file and appends its contents as a DataFrame to the database.
+async def store_database_file(file: UploadFile) -> dict:
+    """Parses an uploaded CSV file and stores it as a table in the database.
 
     Args:
         file (UploadFile): The uploaded CSV file.
-        database (Database): The database instance.
 
     Returns:
-        dict: A message indicating the backend is working.
+        dict: The stored table's name and shape.
     """
-    
     contents: bytes = await file.read()
     decoded: str = contents.decode("utf-8")
     df: pd.DataFrame = pd.read_csv(StringIO(decoded))
@@ -55,6 +50,50 @@ async def upload_db_file(
             "column_names": list(df.columns)
     }
 
+@app.post("/upload-database-file")
+async def upload_db_file(
+    file: UploadFile
+) -> dict:
+    """Uploads a CSV file and appends its contents as a DataFrame to the database.
+
+    Args:
+        file (UploadFile): The uploaded CSV file.
+        database (Database): The database instance.
+
+    Returns:
+        dict: A message indicating the backend is working.
+    """
+    return await store_database_file(file)
+
+@app.post("/upload-database-files")
+async def upload_db_files(
+    files: List[UploadFile]
+) -> dict:
+    """Uploads several CSV files in a single request and stores each as a table.
+
+    A file that fails to parse does not abort the batch; its entry in `results`
+    carries an `error` message instead.
+
+    Args:
+        files (List[UploadFile]): The uploaded CSV files.
+
+    Returns:
+        dict: One result per uploaded file, in upload order.
+    """
+    results = []
+    for file in files:
+        try:
+            results.append(await store_database_file(file))
+        except Exception as e:
+            logging.error(f"Failed to upload {file.filename}: {e}")
+            results.append({"filename": file.filename, "error": str(e)})
+
+    return {
+            "message": "Database files processed",
+            "uploaded": sum("error" not in result for result in results),
+            "results": results
+    }
+
 @app.post("/upload-ground-truth")
 async def upload_gt_file(
     file: UploadFile
@@ -2,8 +2,7 @@ from .clusteror import Clusteror
 from ..encoders.encoder import Encoder
 import hdbscan
 import numpy as np
-from collections import defaultdict
-from typing import List,Dict
+from typing import Callable, List, Dict, Optional
 
 class HDBScan(Clusteror):
     """HDBScan clustering class for text data.
@@ -14,18 +13,25 @@ class HDBScan(Clusteror):
     Attributes:
         encoder (Encoder): The encoder used to convert text into embeddings.
         clusterer (hdbscan.HDBSCAN): The HDBSCAN clustering instance.
+        distance (Optional[Callable[[np.ndarray], np.ndarray]]): Optional function computing a
+            precomputed distance matrix from the embeddings; None lets HDBSCAN use Euclidean distance itself.
     """
 
-    def __init__(self, encoder: Encoder, min_cluster_size: int = 2):
+    def __init__(self, encoder: Encoder, min_cluster_size: int = 2,
+                 distance: Optional[Callable[[np.ndarray], np.ndarray]] = None):
         """Initializes the HDBScan clusteror.
 
         Args:
             encoder (Encoder): An encoder object that provides an `encode` method to convert text to embeddings.
             min_cluster_size (int, optional): The minimum size of clusters; smaller clusters will be considered noise. Defaults to 2.
+            distance (Optional[Callable[[np.ndarray], np.ndarray]], optional): A function mapping embeddings to a
+                square float64 distance matrix, fitted with metric='precomputed'. Defaults to None (metric='euclidean').
         """
         super().__init__(encoder=encoder)
         self.encoder = encoder
-        self.clusterer = hdbscan.HDBSCAN(min_cluster_size=min_cluster_size, metric='euclidean')
+        self.distance = distance
+        metric = 'euclidean' if distance is None else 'precomputed'
+        self.clusterer = hdbscan.HDBSCAN(min_cluster_size=min_cluster_size, metric=metric)
 
     def cluster(self, text: List[str]) -> dict:
         """Clusters a list of text strings using HDBSCAN.
@@ -41,21 +47,22 @@ class HDBScan(Clusteror):
                 where each cluster label maps to a list of text strings belonging to that cluster.
         """
         embeddings = self.encoder.encode(text)
+        if self.distance is not None:
+            embeddings = self.distance(np.ascontiguousarray(embeddings))
         self.clusterer.fit(embeddings)
 
-        labels = self.clusterer.labels_
-        
-        label_map = defaultdict(list)
-        for text_item, label in zip(text, labels):
-            # Convert numpy types to regular Python types for JSON serialization
-            label = int(label) if hasattr(label, 'item') else label
-            if label_map.get(label) is None:
-                label_map[label] = [text_item]
-            else:
-                label_map[label].append(text_item)
+        labels = np.asarray(self.clusterer.labels_, dtype=np.int32)
+        texts = np.asarray(text, dtype=object)
 
-        # Convert defaultdict to regular dict for JSON serialization
-        return {1: dict(label_map)}
+        # Group texts by label with a stable sort so each cluster keeps input order
+        unique_labels, inverse = np.unique(labels, return_inverse=True)
+        order = np.argsort(inverse, kind="stable")
+        bounds = np.searchsorted(inverse[order], np.arange(1, len(unique_labels)))
+        groups = np.split(texts[order], bounds)
+
+        # Convert numpy types to regular Python types for JSON serialization
+        label_map = {int(label): group.tolist() for label, group in zip(unique_labels, groups)}
+        return {1: label_map}
     
     def __str__(self):
         """Returns a string representation of the HDBScan clusteror.
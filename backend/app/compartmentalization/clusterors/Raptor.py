@@ -189,21 +189,19 @@ class RAPTORClusteror(Clusteror):
     
     def create_summaries(self, expanded_df: pd.DataFrame) -> List[str]:
         """Create summaries for each cluster"""
-        all_clusters = expanded_df["cluster"].unique()
+        # Skip unassigned clusters once, then group in a single pass (first-seen order)
+        assigned = expanded_df[expanded_df["cluster"] != -1]
         summaries = []
+        cluster_ids = []
         
-        for cluster_id in all_clusters:
-            if cluster_id == -1:  # Skip unassigned clusters
-                continue
-                
-            cluster_texts = expanded_df[expanded_df["cluster"] == cluster_id]["text"].tolist()
-            
+        for cluster_id, cluster_texts in assigned.groupby("cluster", sort=False)["text"]:
             # Simple summarization - join table descriptions
             summary = f"Cluster {cluster_id} contains tables: " + \
                      "; ".join(cluster_texts)
             summaries.append(summary)
+            cluster_ids.append(cluster_id)
         
-        return summaries, [c for c in all_clusters if c != -1]
+        return summaries, cluster_ids
     
     def cluster_level(self, texts: List[str], level: int) -> Tuple[pd.DataFrame, List[str], List[int]]:
         """Perform clustering for a single level"""
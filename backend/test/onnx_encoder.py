@@ -0,0 +1,49 @@
+from optimum.onnxruntime import ORTModelForFeatureExtraction
+from transformers import AutoTokenizer
+from app.compartmentalization.encoders.encoder import Encoder
+
+import numpy as np
+
+class ONNXEncoder(Encoder):
+    def __init__(self, model_path: str = 'onnx_minilm'):
+        """
+        Initializes the ONNX Runtime encoder from a pre-exported sentence transformer.
+
+        Test-only: needs `optimum[onnxruntime]`, which is not a backend dependency.
+        The model is expected to be exported once with:
+            optimum-cli export onnx --model sentence-transformers/all-MiniLM-L6-v2 onnx_minilm/
+
+        Args:
+            model_path (str): Directory containing the exported ONNX model and its tokenizer.
+                Defaults to 'onnx_minilm'.
+
+        Attributes:
+            tokenizer (AutoTokenizer): The tokenizer saved alongside the exported model.
+            model (ORTModelForFeatureExtraction): The ONNX Runtime model running on CPU.
+        """
+        self.model_path = model_path
+        self.tokenizer = AutoTokenizer.from_pretrained(self.model_path)
+        self.model = ORTModelForFeatureExtraction.from_pretrained(
+            self.model_path, provider="CPUExecutionProvider"
+        )
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        """
+        Encodes a list of input texts into mean-pooled, L2-normalized vector embeddings.
+
+        Args:
+            texts (list[str]): A list of strings to be encoded.
+
+        Returns:
+            np.ndarray: A NumPy array containing the embeddings for each input text.
+        """
+        inputs = self.tokenizer(texts, padding=True, truncation=True, return_tensors="np")
+        hidden = np.asarray(self.model(**inputs).last_hidden_state)
+        mask = inputs["attention_mask"][..., None].astype(hidden.dtype)
+        embeddings = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        # all-MiniLM-L6-v2 ends with a Normalize layer, so match it here
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings
+
+    def __str__(self):
+        return f"ONNX {self.model_path}"
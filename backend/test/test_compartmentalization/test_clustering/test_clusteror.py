@@ -1,24 +1,25 @@
 import sys
 import os
+from functools import partial
 from pathlib import Path
-from typing import List, Union, Optional, Dict
 import logging
-import numpy as np
-from collections import defaultdict, Counter
-from ...util import log_clusters
 
-# Add the backend directory to PYTHONPATH
+# Add the backend and test directories to PYTHONPATH
 sys.path.append(str(Path(__file__).resolve().parents[3]))
+sys.path.append(str(Path(__file__).resolve().parents[2]))
 
 # Now import after setting the path
-from app.compartmentalization.clustering.clusterors.HDBScan import HDBScan
-from app.compartmentalization.clustering.clusterors.Raptor import RAPTORClusteror
-from app.compartmentalization.clustering.encoders.sentence_transformer import SentenceTransformerEncoder
+from app.compartmentalization.clusterors.HDBScan import HDBScan
+from app.compartmentalization.clusterors.Raptor import RAPTORClusteror
+from app.compartmentalization.encoders.sentence_transformer import SentenceTransformerEncoder
+from util import log_clusters, load_descriptions, pairwise_euclidean
 
 import argparse
-import json
-import logging
-from collections import defaultdict
+
+CLUSTERORS = {
+    "hdbScan": partial(HDBScan, distance=pairwise_euclidean),
+    "raptor": RAPTORClusteror,
+}
 
 
 def parse_args():
@@ -27,7 +28,23 @@ def parse_args():
     parser.add_argument(
     "--description_path",
     type=str,
-    default="/home/haseeb/Desktop/EKAI/ExploringDataLakes/backend/test/compartmentalization/clustering/northwind_descriptions.json"
+    default=os.path.join(os.path.dirname(__file__), "northwind_descriptions.json")
+    )
+    parser.add_argument(
+    "--clusterors",
+    nargs="+",
+    choices=list(CLUSTERORS.keys()),
+    default=list(CLUSTERORS.keys())
+    )
+    parser.add_argument(
+    "--onnx",
+    action="store_true",
+    help="Encode with a pre-exported ONNX MiniLM instead of PyTorch"
+    )
+    parser.add_argument(
+    "--onnx_path",
+    type=str,
+    default="onnx_minilm"
     )
 
     return parser.parse_args()
@@ -40,10 +57,9 @@ def main():
       2. Parses command-line arguments to obtain the path to a JSON file containing table descriptions.
       3. Loads table descriptions from the specified JSON file.
       4. Prepares a list of table descriptions for clustering.
-      5. Initializes a sentence transformer encoder and an HDBScan clusteror.
-      6. Logs information about the clusteror and encoder being used.
-      7. Applies the clustering algorithm to the table descriptions.
-      8. Logs the resulting clusters using a utility function.
+      5. Initializes a single encoder shared by every selected clusteror.
+      6. For each clusteror in '--clusterors', logs the clusteror and encoder being used,
+         applies it to the table descriptions and logs the resulting clusters.
 
     Args:
         None
@@ -58,7 +74,8 @@ def main():
 
     Example:
         Run this script from the command line to cluster table descriptions:
-            $ python test_clusteror.py --description_path /path/to/descriptions.json
+            $ python test_clusteror.py --description_path /path/to/descriptions.json --clusterors hdbScan raptor
+        Pass `--onnx --onnx_path onnx_minilm/` to encode with ONNX Runtime instead of PyTorch.
     """
     log_path = os.path.join(os.path.dirname(__file__), "logs.log")
     logging.basicConfig(
@@ -73,21 +90,24 @@ def main():
 
     args = parse_args()
 
-    with open(args.description_path) as f: 
-        data = json.load(f)
-        table_names = list(data["tables"].keys())
-        texts = [f"{table_name} : {data['tables'][table_name]['note']}" for table_name in table_names]  
-
-    encoder = SentenceTransformerEncoder(model_name="all-MiniLM-L6-v2")
-    clusteror = HDBScan(encoder=encoder)
-    
-    logging.info(f"{'-'*100}")
-    logging.info(f"Clusteror: {str(clusteror)}")
-    logging.info(f"Encoder: {str(encoder)}")
-    logging.info(f"{'-'*100}")
-
-    clusters = clusteror.cluster(text=texts)
-    log_clusters(clusters=clusters)
+    _, texts = load_descriptions(args.description_path)
+
+    if args.onnx:
+        from onnx_encoder import ONNXEncoder
+        encoder = ONNXEncoder(model_path=args.onnx_path)
+    else:
+        encoder = SentenceTransformerEncoder(model_name="all-MiniLM-L6-v2")
+
+    for clusteror_name in args.clusterors:
+        clusteror = CLUSTERORS[clusteror_name](encoder=encoder)
+
+        logging.info(f"{'-'*100}")
+        logging.info(f"Clusteror: {str(clusteror)}")
+        logging.info(f"Encoder: {str(encoder)}")
+        logging.info(f"{'-'*100}")
+
+        clusters = clusteror.cluster(text=list(texts))
+        log_clusters(clusters=clusters)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
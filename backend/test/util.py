@@ -1,6 +1,8 @@
 import logging
-from typing import Dict, List
-from app.helper import database
+import math
+import numba
+import numpy as np
+from typing import Dict, List, Tuple
 import os
 import pandas as pd
 import json
@@ -22,12 +24,14 @@ def log_clusters(clusters: dict):
     Example:
         log_clusters({1: {0: ['table1: desc', 'table2: desc'], 1: ['table3: desc']}})
     """
+    if not logging.getLogger().isEnabledFor(logging.INFO):
+        return
     logging.info(f"{'-'*50}")
-    logging.info(f"Logging Clusters")
+    logging.info("Logging Clusters")
     for cluster_level, val in clusters.items():
-        logging.info(f"Cluster Level {cluster_level}")
+        logging.info("Cluster Level %s", cluster_level)
         for clusterID, cluster in val.items():
-            logging.info(f"Cluster {clusterID}: {[desc.split(':')[0] for desc in cluster]}")
+            logging.info("Cluster %s: %s", clusterID, [desc.split(':')[0] for desc in cluster])
         logging.info(f"{'-'*20}")
     logging.info(f"{'-'*50}")
 
@@ -40,11 +44,13 @@ def log_description():
     Example:
         log_description()
     """
+    from app.helper import database
+
     logging.info(f"{'-'*50}")
     logging.info("Testing Dataset Description Generation")
     tables = database.db_description["tables"]
     for table_name, table_desc in tables.items():
-        logging.info(f"{table_name} : {table_desc['note']}")
+        logging.info("%s : %s", table_name, table_desc['note'])
     logging.info(f"{'-'*50}")
 
 def dummyDatabaseCreation(database_dir):
@@ -56,6 +62,8 @@ def dummyDatabaseCreation(database_dir):
     Example:
         dummyDatabaseCreation('/path/to/database_dir')
     """
+    from app.helper import database
+
     table_names = os.listdir(database_dir)
     for table_name in table_names:
         df = pd.read_csv(os.path.join(database_dir, table_name))
@@ -63,4 +71,57 @@ def dummyDatabaseCreation(database_dir):
         for _, row in df.iterrows():
                 row_json = json.dumps(row.to_dict())
                 database.r.lpush(table_name, row_json)
-                
\ No newline at end of file
+
+
+def load_descriptions(description_path: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Parses a table descriptions JSON file and returns its table names and texts.
+
+    Callers load the file once and reuse the result across clusterors, so every
+    run sees a single parse and the same ordering of tables.
+
+    Args:
+        description_path (str): Path to a JSON file of the form {"tables": {name: {"note": ...}}}.
+
+    Returns:
+        Tuple[Tuple[str, ...], Tuple[str, ...]]: The table names and the matching
+            "table_name : note" texts used as clustering input.
+
+    Example:
+        table_names, texts = load_descriptions('/path/to/descriptions.json')
+    """
+    with open(description_path) as f:
+        data = json.load(f)
+    table_names = tuple(data["tables"].keys())
+    texts = tuple(f"{table_name} : {data['tables'][table_name]['note']}" for table_name in table_names)
+    return table_names, texts
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def pairwise_euclidean(X: np.ndarray) -> np.ndarray:
+    """Computes the symmetric Euclidean distance matrix of the rows of `X`.
+
+    Intended as the `distance` argument of `HDBScan`; the output is float64
+    because hdbscan's precomputed linkage expects doubles.
+
+    Args:
+        X (np.ndarray): Embeddings of shape [number of texts, embedding dimensions].
+
+    Returns:
+        np.ndarray: A float64 matrix of shape [number of texts, number of texts].
+
+    Example:
+        HDBScan(encoder=encoder, distance=pairwise_euclidean)
+    """
+    n, d = X.shape
+    D = np.empty((n, n), dtype=np.float64)
+    for i in numba.prange(n):
+        D[i, i] = 0.0
+        for j in range(i + 1, n):
+            s = 0.0
+            for k in range(d):
+                t = X[i, k] - X[j, k]
+                s += t * t
+            v = math.sqrt(s)
+            D[i, j] = v
+            D[j, i] = v
+    return D
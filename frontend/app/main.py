@@ -1,8 +1,6 @@
 import streamlit as st
-import requests
 import json
 from typing import Dict, Any
-import pandas as pd
 from util import *
 
 # Configure the page
@@ -15,6 +13,9 @@ st.set_page_config(
 
 def display_database_description(description: Dict[str, Any]):
     """Display the database description in a formatted way"""
+    # Imported here so pandas only loads once a description is shown
+    import pandas as pd
+
     if not description or "tables" not in description:
         st.warning("No database description available.")
         return
@@ -46,48 +47,63 @@ def welcome_page():
     # Create two columns for better layout
     col1, col2 = st.columns(2)
     
+    # Uploaders live in forms so picking files does not rerun the page until submit
     with col1:
         st.subheader("📁 Upload Database Files")
-        database_files = st.file_uploader(
-            "Choose database files (.csv)",
-            type=['csv'],
-            accept_multiple_files=True,
-            key="db_files"
-        )
+        with st.form("upload_db_form"):
+            database_files = st.file_uploader(
+                "Choose database files (.csv)",
+                type=['csv'],
+                accept_multiple_files=True,
+                key="db_files"
+            )
+            upload_db = st.form_submit_button("Upload Database Files")
         
-        if database_files:
-            if st.button("Upload Database Files", key="upload_db"):
-                progress_bar = st.progress(0)
-                success_count = 0
-                
-                for i, file in enumerate(database_files):
-                    result = upload_database_file(file)
-                    if result:
-                        st.success(f"✅ Uploaded: {file.name}")
-                        success_count += 1
-                    else:
-                        st.error(f"❌ Failed to upload: {file.name}")
-                    
-                    progress_bar.progress((i + 1) / len(database_files))
-                
-                st.info(f"Uploaded {success_count} out of {len(database_files)} files successfully.")
+        if upload_db and not database_files:
+            st.warning("Choose at least one database file to upload.")
+        elif upload_db:
+            success_count = 0
+            
+            progress_bar = st.progress(0)
+            with st.spinner(f"Uploading {len(database_files)} files..."):
+                result = upload_database_files_batch(
+                    database_files, on_progress=progress_bar.progress
+                )
+                if result is None:
+                    result = upload_database_files_concurrently(
+                        database_files, on_progress=progress_bar.progress
+                    )
+            progress_bar.progress(1.0)
+            
+            file_results = result.get("results", []) if result else []
+            for file_result in file_results:
+                if "error" not in file_result:
+                    st.success(f"✅ Uploaded: {file_result['filename']}")
+                    success_count += 1
+                else:
+                    st.error(f"❌ Failed to upload: {file_result['filename']} ({file_result['error']})")
+            
+            st.info(f"Uploaded {success_count} out of {len(database_files)} files successfully.")
     
     with col2:
         st.subheader("🎯 Upload Ground Truth File")
-        ground_truth_file = st.file_uploader(
-            "Choose ground truth file (.json)",
-            type=['json'],
-            key="gt_file"
-        )
+        with st.form("upload_gt_form"):
+            ground_truth_file = st.file_uploader(
+                "Choose ground truth file (.json)",
+                type=['json'],
+                key="gt_file"
+            )
+            upload_gt = st.form_submit_button("Upload Ground Truth")
         
-        if ground_truth_file:
-            if st.button("Upload Ground Truth", key="upload_gt"):
-                result = upload_ground_truth_file(ground_truth_file)
-                if result:
-                    st.success(f"✅ Ground truth uploaded successfully!")
-                    st.json(result)
-                    # Force a rerun to display the database description
-                    st.rerun()
+        if upload_gt and not ground_truth_file:
+            st.warning("Choose a ground truth file to upload.")
+        elif upload_gt:
+            result = upload_ground_truth_file(ground_truth_file)
+            if result:
+                st.success(f"✅ Ground truth uploaded successfully!")
+                st.json(result)
+                # Force a rerun to display the database description
+                st.rerun()
     
     # Action buttons
     st.markdown("---")
@@ -110,7 +126,7 @@ def welcome_page():
     
     with button_col3:
         if st.button("Show database description",key="show_description"):
-            mock_description = get_database_description()
+            mock_description = cached_database_description()
             display_database_description(mock_description)
     
 
@@ -151,7 +167,7 @@ def clustering_page():
     # Display clustering results
     if st.session_state.get('clustering_running', False):
         with st.spinner(f"Running {clustering_methods[selected_method]}..."):
-            result = perform_clustering(selected_method)
+            result = cached_clustering(selected_method)
             
             if result:
                 st.success("✅ Clustering completed successfully!")
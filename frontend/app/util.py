@@ -1,12 +1,64 @@
 import requests
 import streamlit as st
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 API_BASE_URL = "http://backend:8000" 
+UPLOAD_WORKERS = 8
+UPLOAD_BATCH_SIZE = 16
+# (connect, read) timeouts; description generation and clustering run models on the backend
+REQUEST_TIMEOUT = (5, 60)
+LONG_REQUEST_TIMEOUT = (5, 300)
+# The batch route replies only once every file in it is stored row by row, so its
+# read timeout grows with the batch instead of being a flat budget
+UPLOAD_READ_TIMEOUT_PER_FILE = 60
+
+# Shared across reruns and upload threads so connections to the backend are kept alive.
+# Only connect failures and 502/503/504 on GETs are retried. Read errors are not: a timed-out
+# request may still be running on the backend (clustering, row-by-row uploads).
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        read=0,
+        backoff_factor=0.25,
+        status_forcelist=[502, 503, 504]
+    )
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+# One worker pool per process, shared by every Streamlit session, so concurrent
+# users queue behind UPLOAD_WORKERS in-flight uploads instead of each opening their own
+UPLOAD_EXECUTOR = ThreadPoolExecutor(max_workers=UPLOAD_WORKERS, thread_name_prefix="backend-upload")
+
+# Process-wide like the backend database and st.cache_data, so every session and tab
+# sees the same version; bumped by the helpers below whenever they change backend data
+_db_version = 0
+_db_version_lock = threading.Lock()
+
+def bump_db_version():
+    """Invalidate cached backend responses after the backend data changes"""
+    global _db_version
+    # Upload threads bump concurrently; += is not atomic
+    with _db_version_lock:
+        _db_version += 1
+
+class _NoResult(Exception):
+    """Raised inside cached helpers so failed backend calls are not cached"""
 
 def perform_clustering(cluster_method: str):
     """Perform clustering using the specified method"""
     try:
-        response = requests.get(f"{API_BASE_URL}/cluster", params={"cluster_method": cluster_method})
+        response = SESSION.get(
+            f"{API_BASE_URL}/cluster",
+            params={"cluster_method": cluster_method},
+            timeout=LONG_REQUEST_TIMEOUT
+        )
         if response.status_code == 200:
             return response.json()
         else:
@@ -17,21 +69,96 @@ def perform_clustering(cluster_method: str):
         return None
 
 
+def post_database_file(file):
+    """Post a database file to the backend, raising on failure (safe to call from worker threads)"""
+    file.seek(0)
+    files = {"file": (file.name, file, file.type or "text/csv")}
+    response = SESSION.post(f"{API_BASE_URL}/upload-database-file", files=files, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    bump_db_version()
+    return response.json()
+
 def upload_database_file(file):
     """Upload a database file to the backend"""
     try:
-        files = {"file": (file.name, file.getvalue(), "csv")}
-        response = requests.post(f"{API_BASE_URL}/upload-database-file", files=files)
-        return response.json()
+        return post_database_file(file)
     except Exception as e:
         st.error(f"Error uploading database file: {str(e)}")
         return None
 
+def upload_error_message(error):
+    """Describe a failed upload, warning that a timed-out one may already be stored"""
+    if isinstance(error, requests.exceptions.ReadTimeout):
+        return "timed out waiting for the backend; it may still have stored this file, so check before uploading it again"
+    return str(error)
+
+def upload_database_files_concurrently(files, on_progress=None):
+    """Upload database files in parallel, one request per file.
+
+    Results are collected in the calling thread, so `on_progress` may update Streamlit widgets.
+    """
+    results = []
+    futures = {UPLOAD_EXECUTOR.submit(post_database_file, file): file for file in files}
+    for done, future in enumerate(as_completed(futures), start=1):
+        file = futures[future]
+        try:
+            results.append(future.result())
+        except Exception as e:
+            results.append({"filename": file.name, "error": upload_error_message(e)})
+        if on_progress:
+            on_progress(done / len(files))
+    return {"results": results}
+
+def post_database_files_batch(files):
+    """Post several database files in one request, raising on failure; None if the backend has no batch endpoint"""
+    for file in files:
+        file.seek(0)
+    payload = [("files", (file.name, file, file.type or "text/csv")) for file in files]
+    response = SESSION.post(
+        f"{API_BASE_URL}/upload-database-files",
+        files=payload,
+        timeout=(REQUEST_TIMEOUT[0], UPLOAD_READ_TIMEOUT_PER_FILE * len(files))
+    )
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    bump_db_version()
+    return response.json()
+
+def upload_database_files_batch(files, on_progress=None, batch_size=UPLOAD_BATCH_SIZE):
+    """Upload database files in multipart batches of `batch_size`, sending the batches in parallel.
+
+    Returns None when the backend has no batch endpoint, so callers can fall back to per-file uploads.
+    A failed batch marks only its own files as failed.
+    """
+    batches = [files[i:i + batch_size] for i in range(0, len(files), batch_size)]
+    results = []
+    futures = {UPLOAD_EXECUTOR.submit(post_database_files_batch, batch): batch for batch in batches}
+    for done, future in enumerate(as_completed(futures), start=1):
+        batch = futures[future]
+        try:
+            batch_result = future.result()
+        except Exception as e:
+            results.extend({"filename": file.name, "error": upload_error_message(e)} for file in batch)
+        else:
+            if batch_result is None:
+                # Drain the other batches before the caller re-reads the same files per file
+                for pending in futures:
+                    pending.cancel()
+                wait(futures)
+                return None
+            results.extend(batch_result["results"])
+        if on_progress:
+            on_progress(done / len(batches))
+    return {"results": results}
+
 def upload_ground_truth_file(file):
     """Upload a ground truth file to the backend"""
     try:
-        files = {"file": (file.name, file.getvalue(), "application/json")}
-        response = requests.post(f"{API_BASE_URL}/upload-ground-truth", files=files)
+        file.seek(0)
+        files = {"file": (file.name, file, file.type or "application/json")}
+        response = SESSION.post(f"{API_BASE_URL}/upload-ground-truth", files=files, timeout=LONG_REQUEST_TIMEOUT)
+        bump_db_version()
         return response.json()
     except Exception as e:
         st.error(f"Error uploading ground truth file: {str(e)}")
@@ -42,7 +169,7 @@ def get_database_description():
     try:
         # This assumes you have an endpoint to get the database description
         # If not, you'll need to modify your backend to include this endpoint
-        response = requests.get(f"{API_BASE_URL}/database-description")
+        response = SESSION.get(f"{API_BASE_URL}/database-description", timeout=REQUEST_TIMEOUT)
         if response.status_code == 200:
             return response.json()
         else:
@@ -54,8 +181,41 @@ def get_database_description():
 def reset_database():
     """Reset the database"""
     try:
-        response = requests.post(f"{API_BASE_URL}/reset-database")
+        response = SESSION.post(f"{API_BASE_URL}/reset-database", timeout=REQUEST_TIMEOUT)
+        bump_db_version()
         return response.json()
     except Exception as e:
         st.error(f"Error resetting database: {str(e)}")
         return None
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_database_description(db_version: int):
+    description = get_database_description()
+    if description is None:
+        raise _NoResult()
+    return description
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_clustering(cluster_method: str, db_version: int):
+    result = perform_clustering(cluster_method)
+    if result is None:
+        raise _NoResult()
+    return result
+
+
+def cached_database_description():
+    """Get the database description, cached until the backend data changes"""
+    try:
+        return _cached_database_description(_db_version)
+    except _NoResult:
+        return None
+
+
+def cached_clustering(cluster_method: str):
+    """Perform clustering, cached per method until the backend data changes"""
+    try:
+        return _cached_clustering(cluster_method, _db_version)
+    except _NoResult:
+        return None